@@ -0,0 +1,775 @@
+"""
+Asynchronous blockchain interaction module for MortalCoin EVM CLI.
+
+This module provides asyncio versions of the functions in the blockchain module,
+built on AsyncWeb3. Independent RPC requests are awaited concurrently, which gives
+the same latency as JSON-RPC batching on providers that do not support batches.
+Several games can be driven concurrently, e.g. with
+asyncio.gather(*(create_game_async(...) for ...)).
+"""
+
+import asyncio
+import time
+from typing import Dict, Any, AsyncIterator, Optional, Sequence, Tuple, Callable, Union
+
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import AsyncHTTPProvider, AsyncWeb3, WebSocketProvider
+from web3.contract import AsyncContract
+from web3.exceptions import TransactionNotFound
+from web3.types import EventData, RPCEndpoint, TxData, TxReceipt, Wei
+
+from mortalcoin_evm_cli.blockchain import (
+    CREATE_GAME_SELECTOR,
+    HTTP_TIMEOUT,
+    Direction,
+    GameInfo,
+    OrjsonProviderMixin,
+    _BLOCK_TIMES,
+    _CHAIN_IDS,
+    _EIP1559_SUPPORT,
+    _apply_static_gas_limit,
+    _cache_receipt,
+    _cached_receipt,
+    _check_contract_transaction,
+    _close_position_validation,
+    _complete_transaction,
+    _created_game_id,
+    _fee_history_tip,
+    _fetch,
+    _max_poll_interval,
+    _post_position_validation,
+    _preflight_requests,
+    _print_receipt_status,
+    _receipt_from_response,
+    _sign_join_game,
+    _sign_post_position,
+    get_event_topic,
+    hash_direction,
+    load_abi,
+    orjson,
+)
+
+
+class OrjsonAsyncHTTPProvider(OrjsonProviderMixin, AsyncHTTPProvider):
+    """AsyncHTTPProvider that uses orjson for the JSON-RPC payloads."""
+
+
+async def get_async_web3_connection(rpc_url: str) -> AsyncWeb3:
+    """
+    Establish an asynchronous connection to the Ethereum blockchain.
+    
+    Args:
+        rpc_url: The URL of the Ethereum RPC endpoint.
+        
+    Returns:
+        An AsyncWeb3 instance connected to the specified RPC endpoint.
+    """
+    provider_class = OrjsonAsyncHTTPProvider if orjson is not None else AsyncHTTPProvider
+    web3 = AsyncWeb3(provider_class(
+        rpc_url,
+        request_kwargs={"timeout": HTTP_TIMEOUT},
+        # Cache the chain ID, which web3 validates for every eth_call and eth_estimateGas
+        cache_allowed_requests=True,
+        cacheable_requests={RPCEndpoint("eth_chainId")},
+        request_cache_validation_threshold=None
+    ))
+    if not await web3.is_connected():
+        raise ConnectionError(f"Failed to connect to Ethereum node at {rpc_url}")
+    return web3
+
+
+def get_async_contract(web3: AsyncWeb3, contract_address: str) -> AsyncContract:
+    """
+    Get the MortalCoin contract instance for an AsyncWeb3 connection.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract_address: The address of the MortalCoin contract.
+        
+    Returns:
+        An AsyncContract instance.
+    """
+    abi = load_abi()
+    return web3.eth.contract(address=contract_address, abi=abi)
+
+
+async def get_chain_id_async(web3: AsyncWeb3) -> int:
+    """
+    Get the chain ID of a connection, requesting it only once per AsyncWeb3 instance.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        
+    Returns:
+        The chain ID.
+    """
+    chain_id = _CHAIN_IDS.get(web3)
+    if chain_id is None:
+        chain_id = await web3.eth.chain_id
+        _CHAIN_IDS[web3] = chain_id
+    return chain_id
+
+
+async def get_block_time_async(web3: AsyncWeb3, sample_blocks: int = 100) -> float:
+    """
+    Get the average block time of a connection's chain, measuring it only once.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        sample_blocks: The number of recent blocks to average over.
+        
+    Returns:
+        The average block time in seconds.
+    """
+    block_time = _BLOCK_TIMES.get(web3)
+    if block_time is None:
+        latest = await web3.eth.get_block('latest')
+        sample_blocks = min(sample_blocks, latest['number'])
+        if sample_blocks <= 0:
+            return 0.0
+        earlier = await web3.eth.get_block(latest['number'] - sample_blocks)
+        block_time = (latest['timestamp'] - earlier['timestamp']) / sample_blocks
+        _BLOCK_TIMES[web3] = block_time
+    return block_time
+
+
+async def get_game_info_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    game_id: int,
+    raw: bool = False
+) -> Union[Dict[str, Any], GameInfo]:
+    """
+    Get information about a game.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        game_id: The ID of the game.
+        raw: Whether to return a GameInfo instead of a dictionary.
+        
+    Returns:
+        A dictionary (or a GameInfo if raw is True) containing information about the game.
+    """
+    game_info = GameInfo.from_call(await contract.functions.games(game_id).call())
+    return game_info if raw else game_info.to_dict()
+
+
+async def _get_contract_transaction_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    tx_hash: str
+) -> Tuple[TxReceipt, TxData]:
+    """
+    Get a confirmed and successful transaction that was sent to the contract.
+    
+    The receipt (unless it is cached) and the transaction are requested concurrently.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        tx_hash: The transaction hash.
+        
+    Returns:
+        A tuple containing the transaction receipt and the transaction.
+        
+    Raises:
+        ValueError: If the transaction is not found, not confirmed, failed, or was
+            not sent to the contract.
+    """
+    async def get_receipt() -> Optional[TxReceipt]:
+        receipt = _cached_receipt(tx_hash)
+        if receipt is None:
+            try:
+                receipt = await web3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                return None
+            _cache_receipt(receipt)
+        return receipt
+    
+    async def get_transaction() -> Optional[TxData]:
+        try:
+            return await web3.eth.get_transaction(tx_hash)
+        except TransactionNotFound:
+            return None
+    
+    tx_receipt, tx = await asyncio.gather(get_receipt(), get_transaction())
+    if tx_receipt is None or tx is None:
+        raise ValueError("Transaction not found")
+    
+    _check_contract_transaction(contract, tx_receipt, tx)
+    return tx_receipt, tx
+
+
+async def validate_post_position_transaction_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    game_id: int,
+    tx_hash: str,
+    direction: Direction,
+    nonce: int
+) -> Dict[str, Any]:
+    """
+    Validate a transaction that posted a position.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        game_id: The expected game ID.
+        tx_hash: The transaction hash.
+        direction: The direction of the position (Long or Short).
+        nonce: The nonce used for the position.
+        
+    Returns:
+        A dictionary containing validation results.
+        
+    Raises:
+        ValueError: If the transaction validation fails.
+    """
+    _, tx = await _get_contract_transaction_async(web3, contract, tx_hash)
+    return _post_position_validation(tx, game_id, direction, nonce)
+
+
+async def validate_close_position_transaction_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    game_id: int,
+    tx_hash: str,
+    direction: Direction,
+    nonce: int
+) -> Dict[str, Any]:
+    """
+    Validate a transaction that closed a position.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        game_id: The expected game ID.
+        tx_hash: The transaction hash.
+        direction: The direction of the position (Long or Short).
+        nonce: The nonce used for the position.
+        
+    Returns:
+        A dictionary containing validation results and position data.
+        
+    Raises:
+        ValueError: If the transaction validation fails.
+    """
+    tx_receipt, tx = await _get_contract_transaction_async(web3, contract, tx_hash)
+    return _close_position_validation(contract, tx_receipt, tx, game_id, direction, nonce)
+
+
+async def create_game_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    private_key: str,
+    bet_amount: Wei,
+    pool_address: str
+) -> Tuple[str, int]:
+    """
+    Create a new game on the blockchain.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        private_key: The private key of the user.
+        bet_amount: The bet amount in wei.
+        pool_address: The address of the pool.
+        
+    Returns:
+        A tuple containing the transaction hash and the game ID.
+    """
+    # Prepare transaction parameters. The calldata is encoded once here and
+    # reused for both the gas estimate and the signed transaction.
+    tx_params = {
+        'to': contract.address,
+        'value': bet_amount,
+        'data': CREATE_GAME_SELECTOR + encode(['address'], [pool_address])
+    }
+    
+    tx_hash, receipt = await build_sign_send_transaction_async(
+        web3=web3,
+        contract_function=None,
+        private_key=private_key,
+        tx_params=tx_params
+    )
+    
+    # Get the game ID from the GameCreated event in the transaction receipt
+    game_id = _created_game_id(contract.address, receipt)
+    
+    return tx_hash, game_id
+
+
+async def join_game_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    game_id: int,
+    player1_private_key: str,
+    player2_private_key: str,
+    player2_pool: str,
+    bet_amount: Wei,
+    fetch_info: bool = True
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Join an existing game on the blockchain.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        game_id: The ID of the game to join.
+        player1_private_key: The private key of player1 who created the game.
+        player2_private_key: The private key of player2 who is joining the game.
+        player2_pool: The address of player2's pool.
+        bet_amount: The bet amount in wei (must match the game's bet amount).
+        fetch_info: Whether to read the updated game info after joining, which
+            costs an extra eth_call.
+        
+    Returns:
+        A tuple containing the transaction hash and the updated game info (None if
+        fetch_info is False).
+    """
+    # Get accounts from private keys
+    player1_account = web3.eth.account.from_key(player1_private_key)
+    player2_account = web3.eth.account.from_key(player2_private_key)
+    player2_address = player2_account.address
+    
+    # Convert pool address to checksum format
+    player2_pool = AsyncWeb3.to_checksum_address(player2_pool)
+    
+    # Set signature expiration (current time + 1 hour)
+    signature_expiration = int(time.time()) + 3600
+    
+    # Sign the EIP-712 JoinGame message with player1's private key
+    player1_signature = _sign_join_game(
+        player1_account,
+        await get_chain_id_async(web3),
+        contract.address,
+        game_id,
+        player2_address,
+        signature_expiration
+    )
+    
+    # Prepare transaction parameters
+    tx_params = {
+        'from': player2_address,
+        'value': bet_amount
+    }
+    
+    tx_hash, receipt = await build_sign_send_transaction_async(
+        web3=web3,
+        contract_function=contract.functions.joinGame(
+            game_id,
+            player2_pool,
+            signature_expiration,
+            player1_signature
+        ),
+        private_key=player2_private_key,
+        tx_params=tx_params
+    )
+    
+    # Get the updated game info
+    game_info = await get_game_info_async(web3, contract, game_id) if fetch_info else None
+    
+    return tx_hash, game_info
+
+
+async def post_position_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    player_private_key: str,
+    backend_private_key: str,
+    game_id: int,
+    direction: Direction,
+    nonce: int
+) -> str:
+    """
+    Post a position on the blockchain.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        player_private_key: The private key of the player.
+        backend_private_key: The private key of the backend.
+        game_id: The ID of the game.
+        direction: The direction of the position (Long or Short).
+        nonce: A random nonce for the position.
+        
+    Returns:
+        The transaction hash.
+    """
+    # Get accounts from private keys
+    player_account = web3.eth.account.from_key(player_private_key)
+    backend_account = web3.eth.account.from_key(backend_private_key)
+    player_address = player_account.address
+    
+    # Calculate the hashed direction
+    hashed_direction = hash_direction(game_id, direction, nonce)
+    
+    # Sign the EIP-712 PostPosition message with backend's private key
+    backend_signature = _sign_post_position(
+        backend_account,
+        await get_chain_id_async(web3),
+        contract.address,
+        game_id,
+        player_address,
+        hashed_direction
+    )
+    
+    # Prepare transaction parameters
+    tx_params = {
+        'from': player_address
+    }
+    
+    tx_hash, receipt = await build_sign_send_transaction_async(
+        web3=web3,
+        contract_function=contract.functions.postPosition(
+            game_id,
+            hashed_direction,
+            backend_signature
+        ),
+        private_key=player_private_key,
+        tx_params=tx_params
+    )
+    
+    return tx_hash
+
+
+async def close_position_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    private_key: str,
+    game_id: int,
+    direction: Direction,
+    nonce: int
+) -> str:
+    """
+    Close a position on the blockchain.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        private_key: The private key of the player.
+        game_id: The ID of the game.
+        direction: The direction of the position (Long or Short).
+        nonce: The nonce used when posting the position.
+        
+    Returns:
+        The transaction hash.
+    """
+    # Get account from private key
+    account = web3.eth.account.from_key(private_key)
+    
+    # Prepare transaction parameters
+    tx_params = {
+        'from': account.address
+    }
+    
+    tx_hash, receipt = await build_sign_send_transaction_async(
+        web3=web3,
+        contract_function=contract.functions.closePosition(
+            game_id,
+            direction,
+            nonce
+        ),
+        private_key=private_key,
+        tx_params=tx_params
+    )
+    
+    return tx_hash
+
+
+async def finish_game_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    private_key: str,
+    game_id: int,
+    direction: Direction,
+    nonce: int
+) -> str:
+    """
+    Finish a game on the blockchain by calling the finishGame function.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        private_key: The private key of the player.
+        game_id: The ID of the game.
+        direction: The direction of the position (Long or Short).
+        nonce: The nonce used when posting the position.
+        
+    Returns:
+        The transaction hash.
+    """
+    # Get account from private key
+    account = web3.eth.account.from_key(private_key)
+    
+    # Prepare transaction parameters
+    tx_params = {
+        'from': account.address
+    }
+    
+    tx_hash, receipt = await build_sign_send_transaction_async(
+        web3=web3,
+        contract_function=contract.functions.finishGame(
+            game_id,
+            direction,
+            nonce
+        ),
+        private_key=private_key,
+        tx_params=tx_params
+    )
+    
+    return tx_hash
+
+
+async def force_finish_game_async(
+    web3: AsyncWeb3,
+    contract: AsyncContract,
+    private_key: str,
+    game_id: int,
+    player1_direction: Direction,
+    player1_nonce: int,
+    player2_direction: Direction,
+    player2_nonce: int
+) -> str:
+    """
+    Force finish a game on the blockchain by calling the forceFinishGame function.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract: The contract instance.
+        private_key: The private key of the backend.
+        game_id: The ID of the game.
+        player1_direction: The direction of player1's position (Long or Short).
+        player1_nonce: The nonce used when player1 posted the position.
+        player2_direction: The direction of player2's position (Long or Short).
+        player2_nonce: The nonce used when player2 posted the position.
+        
+    Returns:
+        The transaction hash.
+    """
+    # Get account from private key
+    account = web3.eth.account.from_key(private_key)
+    
+    # Prepare transaction parameters
+    tx_params = {
+        'from': account.address
+    }
+    
+    tx_hash, receipt = await build_sign_send_transaction_async(
+        web3=web3,
+        contract_function=contract.functions.forceFinishGame(
+            game_id,
+            player1_direction,
+            player1_nonce,
+            player2_direction,
+            player2_nonce
+        ),
+        private_key=private_key,
+        tx_params=tx_params
+    )
+    
+    return tx_hash
+
+
+async def build_sign_send_transaction_async(
+    web3: AsyncWeb3,
+    contract_function: Optional[Callable],
+    private_key: str,
+    tx_params: Dict[str, Any],
+    static_gas: Optional[bool] = None
+) -> Tuple[str, TxReceipt]:
+    """
+    Build, sign, and send a transaction for a contract function call.
+    
+    The nonce, gas estimate, fee data and (on first use) chain ID are requested
+    concurrently.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        contract_function: The contract function to call, or None if tx_params
+            already contains the encoded call ('to' and 'data').
+        private_key: The private key to sign the transaction with.
+        tx_params: Transaction parameters (from, value, etc.).
+        static_gas: Whether to use the gas limit from GAS_LIMITS instead of a gas
+            estimate, or None (the default) to decide from the
+            MORTALCOIN_STATIC_GAS_LIMITS environment variable.
+        
+    Returns:
+        A tuple containing the transaction hash (0x-prefixed hex string) and the transaction receipt.
+    """
+    # Get the account from the private key
+    account = web3.eth.account.from_key(private_key)
+    address = account.address
+    
+    # Ensure 'from' address is set correctly
+    tx_params['from'] = address
+    
+    # Encode the call once, so the transaction dict can be built directly
+    if contract_function is not None:
+        tx_params['to'] = contract_function.address
+        tx_params['data'] = contract_function._encode_transaction_data()
+    tx_params.setdefault('value', 0)
+    
+    # A static gas limit makes the gas estimate request unnecessary
+    _apply_static_gas_limit(tx_params, static_gas)
+    
+    # The chain ID and EIP-1559 support are cached the same way as for Web3 connections
+    chain_id = _CHAIN_IDS.get(web3)
+    eip1559_support = _EIP1559_SUPPORT.get(chain_id) if chain_id is not None else None
+    
+    preflight = _preflight_requests(web3, address, tx_params, chain_id, eip1559_support)
+    if eip1559_support is None and 'gasPrice' not in tx_params:
+        # The gas price is only needed if the chain turns out not to support EIP-1559,
+        # but requesting it concurrently is cheaper than a second round-trip later
+        preflight['gas_price'] = lambda: web3.eth.gas_price
+    
+    results = await asyncio.gather(
+        *(request() for request in preflight.values()),
+        return_exceptions=True
+    )
+    prefetched = dict(zip(preflight, results))
+    
+    # Get the chain ID if it is not cached yet
+    if chain_id is None:
+        chain_id = _fetch(prefetched, 'chain_id')
+        _CHAIN_IDS[web3] = chain_id
+    
+    # Some nodes return a fee history without rewards, and the median tip of an empty
+    # block is 0; the tip is then requested on its own
+    fee_history = prefetched.get('fee_history')
+    if isinstance(fee_history, dict) and fee_history.get('baseFeePerGas') and not _fee_history_tip(fee_history):
+        prefetched['max_priority_fee'] = await web3.eth.max_priority_fee
+    if eip1559_support is False and 'gas_price' not in prefetched and 'gasPrice' not in tx_params:
+        prefetched['gas_price'] = await web3.eth.gas_price
+    
+    def missing(name: str) -> Any:
+        raise KeyError(f"{name} was not fetched")
+    
+    transaction = _complete_transaction(tx_params, chain_id, eip1559_support, prefetched, missing)
+    
+    # Sign the transaction
+    signed_txn = web3.eth.account.sign_transaction(transaction, private_key)
+    
+    # Send the transaction
+    tx_hash = await web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+    
+    # Hex-encode the hash once for printing and returning
+    tx_hash_hex = tx_hash.to_0x_hex()
+    
+    # Wait for the transaction to be mined
+    print(f"Transaction sent: {tx_hash_hex}")
+    print("Waiting for transaction to be mined...")
+    
+    # Pass the raw hash bytes, which web3 accepts without parsing the hex string
+    receipt = await wait_for_transaction_receipt_async(web3, tx_hash)
+    
+    return tx_hash_hex, receipt
+
+
+async def wait_for_transaction_receipt_async(
+    web3: AsyncWeb3,
+    tx_hash: Union[str, bytes],
+    timeout: int = 120,
+    poll_interval: float = 0.5,
+    max_poll_interval: Optional[float] = None,
+    verbose: bool = False
+) -> TxReceipt:
+    """
+    Wait for a transaction receipt to be available.
+    
+    Polls with the same exponential backoff as wait_for_transaction_receipt.
+    
+    Args:
+        web3: An AsyncWeb3 instance.
+        tx_hash: The transaction hash.
+        timeout: The maximum time to wait in seconds.
+        poll_interval: The initial interval between polls in seconds.
+        max_poll_interval: The maximum interval between polls in seconds. By default
+            half the block time if it was measured with get_block_time_async.
+        verbose: Whether to print a progress indicator while polling.
+        
+    Returns:
+        The transaction receipt.
+        
+    Raises:
+        TimeoutError: If the transaction receipt is not available within the timeout.
+    """
+    # Raw RPC calls return a null result while the transaction is pending,
+    # instead of web3 raising TransactionNotFound on every poll
+    params = [HexBytes(tx_hash).to_0x_hex()]
+    
+    max_poll_interval = _max_poll_interval(web3, max_poll_interval)
+    
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    attempt = 0
+    while True:
+        response = await web3.provider.make_request(RPCEndpoint("eth_getTransactionReceipt"), params)
+        receipt = _receipt_from_response(response)
+        if receipt is not None:
+            _print_receipt_status(receipt)
+            return receipt
+        
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TimeoutError(f"Transaction not mined within {timeout} seconds")
+        
+        # Print a progress indicator, one dot per poll
+        if verbose:
+            print(".", end="", flush=True)
+        
+        # Back off exponentially between polls, without sleeping past the deadline
+        await asyncio.sleep(min(max_poll_interval, poll_interval * 1.5 ** attempt, remaining))
+        attempt += 1
+
+
+# Events of a game, in the order they are emitted; gameId is the first indexed
+# argument of all of them
+GAME_EVENTS = ("GameCreated", "GameStarted", "PositionPosted", "PositionClosed", "GameFinished")
+
+
+async def watch_game(
+    ws_url: str,
+    contract_address: str,
+    game_id: int,
+    events: Sequence[str] = GAME_EVENTS
+) -> AsyncIterator[EventData]:
+    """
+    Watch the events of a game as they are emitted.
+    
+    A single eth_subscribe("logs") subscription filtered on the contract, the
+    event topics and the game ID replaces polling the games() getter: the node
+    only sends something when one of the events is actually emitted.
+    
+    Args:
+        ws_url: The URL of the WebSocket RPC endpoint.
+        contract_address: The address of the MortalCoin contract.
+        game_id: The ID of the game.
+        events: The names of the events to watch.
+        
+    Yields:
+        The decoded events, as returned by process_log.
+    """
+    async with AsyncWeb3(WebSocketProvider(ws_url)) as w3:
+        contract = get_async_contract(w3, contract_address)
+        
+        # Map the topic of every watched event to the event used to decode it
+        decoders = {get_event_topic(name): contract.events[name]() for name in events}
+        
+        # Matching the first indexed argument (topics[1]) to the game ID lets the
+        # node drop the events of all other games
+        await w3.eth.subscribe("logs", {
+            "address": contract.address,
+            "topics": [
+                [HexBytes(topic).to_0x_hex() for topic in decoders],
+                HexBytes(game_id.to_bytes(32, 'big')).to_0x_hex()
+            ]
+        })
+        
+        async for message in w3.socket.process_subscriptions():
+            log = message["result"]
+            decoder = decoders.get(bytes(log["topics"][0]))
+            if decoder is not None:
+                yield decoder.process_log(log)
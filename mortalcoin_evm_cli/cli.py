@@ -5,43 +5,251 @@ This module provides the command-line interface for interacting with the MortalC
 smart contract on the Ethereum blockchain.
 """
 
+import contextlib
+import functools
 import json
+import os
 import sys
+from decimal import Decimal, InvalidOperation, localcontext
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
 
 import click
 from dotenv import load_dotenv
-from web3 import Web3
 
-from mortalcoin_evm_cli.blockchain import (
-    Direction,
-    get_web3_connection,
-    get_contract,
-    create_game,
-    get_game_info,
-    validate_create_game_transaction,
-    validate_join_game_transaction,
-    validate_post_position_transaction,
-    validate_close_position_transaction,
-    join_game,
-    post_position,
-    close_position,
-    finish_game,
-    force_finish_game,
-)
+# The commands import mortalcoin_evm_cli.blockchain (and so web3) themselves, so
+# that --help and --version don't pay for importing web3
+if TYPE_CHECKING:
+    from mortalcoin_evm_cli.blockchain import Direction
+
+
+@functools.lru_cache(maxsize=None)
+def _direction(name: str) -> "Direction":
+    """
+    Get a position direction from its command line name.
+    
+    The result is cached, so the batch commands resolve each spelling of a
+    direction with a single dict lookup however many entries use it.
+    
+    Args:
+        name: The direction name (Long or Short), in any case.
+        
+    Returns:
+        The Direction enum member.
+    """
+    from mortalcoin_evm_cli.blockchain import Direction
+    
+    return Direction[name.capitalize()]
+
+
+def _emit_json(obj: Any, indent: Optional[bool] = None) -> None:
+    """
+    Print an object as JSON, indented when stdout is a terminal.
+    
+    The JSON is written straight to stdout, with orjson when it is installed,
+    instead of being built as a string and passed through click.echo. When
+    stdout is not a terminal (e.g. a pipe), the JSON is printed compactly on a
+    single line, which is quicker to write and to parse.
+    
+    Args:
+        obj: The object to print.
+        indent: Whether to indent the JSON, or None to indent it only when stdout
+            is a terminal. JSON Lines output passes False.
+    """
+    from mortalcoin_evm_cli.blockchain import orjson
+    
+    if indent is None:
+        indent = sys.stdout.isatty()
+    if orjson is not None:
+        try:
+            click.echo(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+            return
+        except TypeError:
+            # orjson does not serialize integers wider than 64 bits
+            pass
+    json.dump(obj, sys.stdout, indent=2 if indent else None, separators=None if indent else (",", ":"))
+    sys.stdout.write("\n")
+
+
+def _echo_lines(*lines: str) -> None:
+    """
+    Print several lines with a single write.
+    
+    click.echo flushes stdout after every call, so printing a block of results
+    line by line costs one write per line when stdout is a pipe.
+    
+    Args:
+        lines: The lines to print.
+    """
+    click.echo("\n".join(lines))
+
+
+class HexOrDecimalInt(click.ParamType):
+    """Click parameter type for integers given as decimal numbers or 0x-prefixed hex."""
+    
+    name = "integer"
+    
+    def convert(self, value: Any, param: Any, ctx: Any) -> int:
+        if isinstance(value, int):
+            return value
+        try:
+            return int(value, 16) if value.startswith("0x") else int(value)
+        except ValueError:
+            self.fail(f"{value} is not a decimal number or 0x-prefixed hex.", param, ctx)
+
+
+HEX_OR_DECIMAL_INT = HexOrDecimalInt()
+
+
+def _parse_int(value: str, label: str) -> int:
+    """
+    Parse an integer that is not given as an option, like HEX_OR_DECIMAL_INT does.
+    
+    Args:
+        value: The value to parse.
+        label: The name of the value shown in the error message.
+        
+    Returns:
+        The parsed integer.
+    """
+    try:
+        return HEX_OR_DECIMAL_INT.convert(value, None, None)
+    except click.BadParameter:
+        click.echo(f"Error: Invalid {label} format: {value}. Must be a decimal number or 0x-prefixed hex.")
+        sys.exit(1)
+
+
+# Number of Wei in one ETH
+WEI_PER_ETHER = 10 ** 18
+
+
+def _parse_ether(value: str, label: str) -> int:
+    """
+    Parse an amount in ETH given on the command line and convert it to Wei.
+    
+    The amount is parsed as a Decimal, so e.g. 0.1 ETH is exactly 10**17 Wei,
+    without going through a binary float.
+    
+    Args:
+        value: The amount in ETH.
+        label: The name of the amount shown in the error message.
+        
+    Returns:
+        The amount in Wei.
+    """
+    try:
+        # Enough precision that the multiplication never rounds
+        with localcontext() as context:
+            context.prec = 100
+            amount = Decimal(value) * WEI_PER_ETHER
+    except InvalidOperation:
+        amount = None
+    if amount is None or not amount.is_finite() or amount < 0 or amount != amount.to_integral_value():
+        click.echo(f"Error: Invalid {label}: {value}. Must be a non-negative number of ETH with at most 18 decimals.")
+        sys.exit(1)
+    return int(amount)
+
+
+@functools.lru_cache(maxsize=256)
+def _checksum_address(address: str) -> Optional[str]:
+    """
+    Convert an address to checksum format, or return None if it is not valid.
+    
+    The result is cached, so the EIP-55 checksum of an address is only computed once
+    per process even when it is given to several commands.
+    """
+    from web3 import Web3
+    
+    # Converting the address validates its format as well, which saves a separate
+    # Web3.is_address pass over it
+    try:
+        return Web3.to_checksum_address(address)
+    except ValueError:
+        return None
+
+
+class ChecksumAddress(click.ParamType):
+    """Click parameter type for addresses, converted to checksum format."""
+    
+    name = "address"
+    
+    def convert(self, value: Any, param: Any, ctx: Any) -> str:
+        checksum_address = _checksum_address(value)
+        if checksum_address is None:
+            self.fail(f"{value} is not a valid address.", param, ctx)
+        return checksum_address
+
+
+CHECKSUM_ADDRESS = ChecksumAddress()
+
+
+def _handle_errors(command: Callable) -> Callable:
+    """
+    Report the errors of a command as a one-line message and exit with status 1.
+    
+    Click's own errors (e.g. invalid options) and sys.exit calls are not caught, so
+    they keep their usual message and exit status.
+    
+    Args:
+        command: The command callback.
+        
+    Returns:
+        The wrapped callback.
+    """
+    @functools.wraps(command)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return command(*args, **kwargs)
+        except click.ClickException:
+            raise
+        except Exception as e:
+            click.echo(f"Error: {str(e)}")
+            sys.exit(1)
+    return wrapper
 
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Settings that are read from the environment outside of the command options, and
+# so can also come from the .env file (see blockchain.STATIC_GAS_LIMITS_ENV)
+DOTENV_SETTINGS = ("MORTALCOIN_STATIC_GAS_LIMITS",)
+
+
+def _needs_dotenv(ctx: click.Context) -> bool:
+    """
+    Check whether the invoked command could read a setting from the .env file.
+    
+    Args:
+        ctx: The context of the main group.
+        
+    Returns:
+        False if every environment variable the command's options read, and every
+        variable of DOTENV_SETTINGS, is already set, and True otherwise.
+    """
+    command = main.get_command(ctx, ctx.invoked_subcommand) if ctx.invoked_subcommand else None
+    if command is None:
+        return True
+    if any(envvar not in os.environ for envvar in DOTENV_SETTINGS):
+        return True
+    for param in command.params:
+        envvars = [param.envvar] if isinstance(param.envvar, str) else param.envvar or []
+        if any(envvar not in os.environ for envvar in envvars):
+            return True
+    return False
 
 
 @click.group()
 @click.version_option()
-def main():
+@click.pass_context
+def main(ctx: click.Context):
     """MortalCoin EVM CLI tool for interacting with the MortalCoin smart contract."""
-    pass
+    # Load environment variables from .env file if it exists. This runs before the
+    # command's options are parsed, so their environment variables can come from it;
+    # the file search is skipped when it cannot provide any of them, or when
+    # scripts that pass every option ask to skip it
+    if not os.environ.get("MORTALCOIN_SKIP_DOTENV") and _needs_dotenv(ctx):
+        load_dotenv()
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--private-key",
     required=True,
@@ -51,33 +259,35 @@ def main():
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of the MortalCoin smart contract.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
 @click.option(
     "--bet-amount",
     required=True,
-    type=float,
     help="Bet amount in ETH.",
     envvar="MORTALCOIN_BET_AMOUNT",
 )
 @click.option(
     "--pool-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of the pool.",
     envvar="MORTALCOIN_POOL_ADDRESS",
 )
 def create_game_command(
     private_key: str,
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
     contract_address: str,
-    bet_amount: float,
+    bet_amount: str,
     pool_address: str,
 ):
     """
@@ -87,63 +297,54 @@ def create_game_command(
     and pool address. It then waits for the transaction to be mined and retrieves
     the game information.
     """
-    try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        if not Web3.is_address(pool_address):
-            click.echo(f"Error: Invalid pool address: {pool_address}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        pool_address = Web3.to_checksum_address(pool_address)
-        
-        # Convert bet amount from ETH to Wei
-        bet_amount_wei = Web3.to_wei(bet_amount, "ether")
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Create the game
-        click.echo(f"Creating game with bet amount {bet_amount} ETH and pool address {pool_address}...")
-        tx_hash, game_id = create_game(
-            web3=web3,
-            contract=contract,
-            private_key=private_key,
-            bet_amount=bet_amount_wei,
-            pool_address=pool_address,
-        )
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        create_game,
+        get_game_info,
+    )
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Convert bet amount from ETH to Wei
+    bet_amount_wei = _parse_ether(bet_amount, "bet amount")
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Create the game
+    click.echo(f"Creating game with bet amount {bet_amount} ETH and pool address {pool_address}...")
+    tx_hash, game_id = create_game(
+        web3=web3,
+        contract=contract,
+        private_key=private_key,
+        bet_amount=bet_amount_wei,
+        pool_address=pool_address,
+    )
+    
+    click.echo(f"Transaction hash: {tx_hash}")
+    
+    if game_id is not None:
+        click.echo(f"Game created with ID: {game_id}")
         
-        click.echo(f"Transaction hash: {tx_hash}")
+        # Get the game information
+        click.echo("Retrieving game information...")
+        game_info = get_game_info(web3, contract, game_id)
         
-        if game_id is not None:
-            click.echo(f"Game created with ID: {game_id}")
-            
-            # Get the game information
-            click.echo("Retrieving game information...")
-            game_info = get_game_info(web3, contract, game_id)
-            
-            # Print the game information
-            click.echo("Game information:")
-            click.echo(json.dumps(game_info, indent=2))
-        else:
-            click.echo("Failed to retrieve game ID.")
-    
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        sys.exit(1)
+        # Print the game information
+        click.echo("Game information:")
+        _emit_json(game_info)
+    else:
+        click.echo("Failed to retrieve game ID.")
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--game-id",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Game ID in 0x-prefixed hex format.",
 )
 @click.option(
@@ -154,26 +355,29 @@ def create_game_command(
 @click.option(
     "--pool-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Pool address in 0x-prefixed hex format.",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Smart contract address in 0x-prefixed hex format.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 def validate_create_game_command(
-    game_id: str,
+    game_id: int,
     tx_hash: str,
     pool_address: str,
     contract_address: str,
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
 ):
     """
     Validate a transaction that created a game.
@@ -184,85 +388,70 @@ def validate_create_game_command(
     - The transaction actually called createGame with the expected pool address
     - The transaction call returned the expected gameId
     """
-    try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        if not Web3.is_address(pool_address):
-            click.echo(f"Error: Invalid pool address: {pool_address}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        pool_address = Web3.to_checksum_address(pool_address)
-        
-        # Convert game_id from hex to int if it's in hex format
-        if game_id.startswith("0x"):
-            game_id_int = int(game_id, 16)
-        else:
-            try:
-                game_id_int = int(game_id)
-            except ValueError:
-                click.echo(f"Error: Invalid game ID format: {game_id}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Validate the transaction
-        click.echo(f"Validating transaction {tx_hash} for game ID {game_id}...")
-        validation_result = validate_create_game_transaction(
-            web3=web3,
-            contract=contract,
-            game_id=game_id_int,
-            tx_hash=tx_hash,
-            pool_address=pool_address,
-        )
-        
-        # Print the validation results
-        click.echo("Validation successful!")
-        click.echo("Results:")
-        click.echo(f"- Transaction confirmed: {validation_result['confirmed']}")
-        click.echo(f"- Transaction successful: {validation_result['successful']}")
-        click.echo(f"- Called createGame function: {validation_result['called_create_game']}")
-        click.echo(f"- Pool address matches: {validation_result['pool_address_match']}")
-        click.echo(f"- Game ID valid: {validation_result['game_id_valid']}")
-        
-        # Print the game information
-        click.echo("\nGame information:")
-        click.echo(json.dumps(validation_result['game_info'], indent=2))
-        
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        sys.exit(1)
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        validate_create_game_transaction,
+    )
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Validate the transaction
+    click.echo(f"Validating transaction {tx_hash} for game ID {game_id}...")
+    validation_result = validate_create_game_transaction(
+        web3=web3,
+        contract=contract,
+        game_id=game_id,
+        tx_hash=tx_hash,
+        pool_address=pool_address,
+    )
+    
+    # Print the validation results
+    _echo_lines(
+        "Validation successful!",
+        "Results:",
+        f"- Transaction confirmed: {validation_result['confirmed']}",
+        f"- Transaction successful: {validation_result['successful']}",
+        f"- Called createGame function: {validation_result['called_create_game']}",
+        f"- Pool address matches: {validation_result['pool_address_match']}",
+        f"- Game ID valid: {validation_result['game_id_valid']}",
+    )
+    
+    # Print the game information
+    click.echo("\nGame information:")
+    _emit_json(validation_result['game_info'])
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of the MortalCoin smart contract in 0x-prefixed hex format.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
 @click.option(
     "--game-id",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Game ID in 0x-prefixed hex format or decimal.",
 )
 @click.option(
     "--player2-pool",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of player2's pool in 0x-prefixed hex format.",
 )
 @click.option(
@@ -271,9 +460,9 @@ def validate_create_game_command(
     help="Transaction hash in 0x-prefixed hex format.",
 )
 def validate_join_game_command(
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
     contract_address: str,
-    game_id: str,
+    game_id: int,
     player2_pool: str,
     tx_hash: str,
 ):
@@ -285,80 +474,64 @@ def validate_join_game_command(
     - The transaction execution was successful
     - The transaction actually called joinGame with the expected game ID and pool address
     """
-    try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        if not Web3.is_address(player2_pool):
-            click.echo(f"Error: Invalid pool address: {player2_pool}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        player2_pool = Web3.to_checksum_address(player2_pool)
-        
-        # Convert game_id from hex to int if it's in hex format
-        if game_id.startswith("0x"):
-            game_id_int = int(game_id, 16)
-        else:
-            try:
-                game_id_int = int(game_id)
-            except ValueError:
-                click.echo(f"Error: Invalid game ID format: {game_id}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Validate the transaction
-        click.echo(f"Validating transaction {tx_hash} for game ID {game_id}...")
-        validation_result = validate_join_game_transaction(
-            web3=web3,
-            contract=contract,
-            game_id=game_id_int,
-            tx_hash=tx_hash,
-            pool_address=player2_pool,
-        )
-        
-        # Print the validation results
-        click.echo("Validation successful!")
-        click.echo("Results:")
-        click.echo(f"- Transaction confirmed: {validation_result['confirmed']}")
-        click.echo(f"- Transaction successful: {validation_result['successful']}")
-        click.echo(f"- Called joinGame function: {validation_result['called_join_game']}")
-        click.echo(f"- Game ID matches: {validation_result['game_id_match']}")
-        click.echo(f"- Pool address matches: {validation_result['pool_address_match']}")
-        
-        # Print the game information
-        click.echo("\nGame information:")
-        click.echo(json.dumps(validation_result['game_info'], indent=2))
-        
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        sys.exit(1)
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        validate_join_game_transaction,
+    )
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Validate the transaction
+    click.echo(f"Validating transaction {tx_hash} for game ID {game_id}...")
+    validation_result = validate_join_game_transaction(
+        web3=web3,
+        contract=contract,
+        game_id=game_id,
+        tx_hash=tx_hash,
+        pool_address=player2_pool,
+    )
+    
+    # Print the validation results
+    _echo_lines(
+        "Validation successful!",
+        "Results:",
+        f"- Transaction confirmed: {validation_result['confirmed']}",
+        f"- Transaction successful: {validation_result['successful']}",
+        f"- Called joinGame function: {validation_result['called_join_game']}",
+        f"- Game ID matches: {validation_result['game_id_match']}",
+        f"- Pool address matches: {validation_result['pool_address_match']}",
+    )
+    
+    # Print the game information
+    click.echo("\nGame information:")
+    _emit_json(validation_result['game_info'])
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of the MortalCoin smart contract in 0x-prefixed hex format.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
 @click.option(
     "--game-id",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Game ID in 0x-prefixed hex format.",
 )
 @click.option(
@@ -374,22 +547,22 @@ def validate_join_game_command(
 @click.option(
     "--player2-pool",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of player2's pool in 0x-prefixed hex format.",
 )
 @click.option(
     "--bet-amount",
     required=True,
-    type=float,
     help="Bet amount in ETH (must match the game's bet amount).",
 )
 def join_game_command(
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
     contract_address: str,
-    game_id: str,
+    game_id: int,
     player1_privkey: str,
     player2_privkey: str,
     player2_pool: str,
-    bet_amount: float,
+    bet_amount: str,
 ):
     """
     Join an existing game on the blockchain.
@@ -403,72 +576,53 @@ def join_game_command(
     from player2's account to join the game. It waits for confirmation and prints the
     updated state of the game.
     """
-    try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        if not Web3.is_address(player2_pool):
-            click.echo(f"Error: Invalid player2 pool address: {player2_pool}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        player2_pool = Web3.to_checksum_address(player2_pool)
-        
-        # Convert game_id from hex to int if it's in hex format
-        if game_id.startswith("0x"):
-            game_id_int = int(game_id, 16)
-        else:
-            try:
-                game_id_int = int(game_id)
-            except ValueError:
-                click.echo(f"Error: Invalid game ID format: {game_id}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Convert bet amount from ETH to Wei
-        bet_amount_wei = Web3.to_wei(bet_amount, "ether")
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Join the game
-        click.echo(f"Joining game {game_id} with bet amount {bet_amount} ETH and player2 pool address {player2_pool}...")
-        tx_hash, game_info = join_game(
-            web3=web3,
-            contract=contract,
-            game_id=game_id_int,
-            player1_private_key=player1_privkey,
-            player2_private_key=player2_privkey,
-            player2_pool=player2_pool,
-            bet_amount=bet_amount_wei,
-        )
-        
-        click.echo(f"Transaction hash: {tx_hash}")
-        
-        # Print the game information
-        click.echo("Game information:")
-        click.echo(json.dumps(game_info, indent=2))
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        join_game,
+    )
     
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        sys.exit(1)
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Convert bet amount from ETH to Wei
+    bet_amount_wei = _parse_ether(bet_amount, "bet amount")
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Join the game
+    click.echo(f"Joining game {game_id} with bet amount {bet_amount} ETH and player2 pool address {player2_pool}...")
+    tx_hash, game_info = join_game(
+        web3=web3,
+        contract=contract,
+        game_id=game_id,
+        player1_private_key=player1_privkey,
+        player2_private_key=player2_privkey,
+        player2_pool=player2_pool,
+        bet_amount=bet_amount_wei,
+    )
+    
+    click.echo(f"Transaction hash: {tx_hash}")
+    
+    # Print the game information
+    click.echo("Game information:")
+    _emit_json(game_info)
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of the MortalCoin smart contract in 0x-prefixed hex format.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
@@ -485,6 +639,7 @@ def join_game_command(
 @click.option(
     "--game-id",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Game ID in 0x-prefixed hex format.",
 )
 @click.option(
@@ -496,16 +651,17 @@ def join_game_command(
 @click.option(
     "--nonce",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Nonce in 0x-prefixed hex format.",
 )
 def post_position_command(
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
     contract_address: str,
     player_privkey: str,
     backend_privkey: str,
-    game_id: str,
+    game_id: int,
     direction: str,
-    nonce: str,
+    nonce: int,
 ):
     """
     Post a position on the blockchain.
@@ -521,79 +677,157 @@ def post_position_command(
     and submits a transaction from the player's account to post the position.
     It waits for confirmation and prints the transaction hash.
     """
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        post_position,
+    )
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Convert direction to enum value
+    direction_enum = _direction(direction)
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Post the position
+    click.echo(f"Posting {direction} position for game {game_id} with nonce {nonce}...")
+    tx_hash = post_position(
+        web3=web3,
+        contract=contract,
+        player_private_key=player_privkey,
+        backend_private_key=backend_privkey,
+        game_id=game_id,
+        direction=direction_enum,
+        nonce=nonce,
+    )
+    
+    click.echo(f"Transaction hash: {tx_hash}")
+
+
+@main.command("post-position-batch")
+@_handle_errors
+@click.option(
+    "--rpc-url",
+    required=True,
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
+    envvar="MORTALCOIN_RPC_URL",
+)
+@click.option(
+    "--contract-address",
+    required=True,
+    type=CHECKSUM_ADDRESS,
+    help="Address of the MortalCoin smart contract in 0x-prefixed hex format.",
+    envvar="MORTALCOIN_CONTRACT_ADDRESS",
+)
+@click.option(
+    "--player-privkey",
+    required=True,
+    help="Private key of the player in 0x-prefixed hex format.",
+)
+@click.option(
+    "--backend-privkey",
+    required=True,
+    help="Private key of the backend in 0x-prefixed hex format.",
+)
+@click.option(
+    "--input-file",
+    required=True,
+    type=click.File("r"),
+    help='JSON file with a list of {"game_id", "direction", "nonce"} positions, or - for stdin.',
+)
+def post_position_batch_command(
+    rpc_url: Tuple[str, ...],
+    contract_address: str,
+    player_privkey: str,
+    backend_privkey: str,
+    input_file,
+):
+    """
+    Post several positions of a player at once.
+    
+    This command posts every position listed in the input file, in one process and
+    with the transactions sent together in a single JSON-RPC batch, instead of one
+    post-position-command invocation per position. Game IDs and nonces are given
+    like for post-position-command, as decimal numbers or 0x-prefixed hex.
+    
+    It waits for all transactions to be mined and prints a JSON list with the
+    transaction hash (or the error) of each position. Progress messages are
+    printed to stderr, so stdout only holds the JSON list.
+    """
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        post_positions,
+    )
+    
+    # Read the positions before connecting, so a malformed file fails fast
     try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        
-        # Convert game_id from hex to int if it's in hex format
-        if game_id.startswith("0x"):
-            game_id_int = int(game_id, 16)
-        else:
-            try:
-                game_id_int = int(game_id)
-            except ValueError:
-                click.echo(f"Error: Invalid game ID format: {game_id}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Convert direction to enum value
-        direction_enum = Direction.Long if direction.lower() == "long" else Direction.Short
-        
-        # Convert nonce from hex to int if it's in hex format
-        if nonce.startswith("0x"):
-            nonce_int = int(nonce, 16)
-        else:
-            try:
-                nonce_int = int(nonce)
-            except ValueError:
-                click.echo(f"Error: Invalid nonce format: {nonce}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Post the position
-        click.echo(f"Posting {direction} position for game {game_id} with nonce {nonce}...")
-        tx_hash = post_position(
+        entries = json.load(input_file)
+        positions = [
+            (
+                _parse_int(str(entry["game_id"]), "game ID"),
+                _direction(str(entry["direction"])),
+                _parse_int(str(entry["nonce"]), "nonce"),
+            )
+            for entry in entries
+        ]
+    except (ValueError, TypeError, KeyError) as e:
+        click.echo(f"Error: Invalid input file: {e}", err=True)
+        sys.exit(1)
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Post the positions. The messages printed while sending and waiting for the
+    # transactions go to stderr, so they do not mix with the JSON output
+    click.echo(f"Posting {len(positions)} positions...", err=True)
+    with contextlib.redirect_stdout(sys.stderr):
+        outcomes = post_positions(
             web3=web3,
             contract=contract,
             player_private_key=player_privkey,
             backend_private_key=backend_privkey,
-            game_id=game_id_int,
-            direction=direction_enum,
-            nonce=nonce_int,
+            positions=positions,
         )
-        
-        click.echo(f"Transaction hash: {tx_hash}")
-        
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
+    
+    # Print the outcome of every position
+    _emit_json([
+        {"game_id": game_id, "error": str(outcome)} if isinstance(outcome, Exception)
+        else {"game_id": game_id, "tx_hash": outcome}
+        for (game_id, _, _), outcome in zip(positions, outcomes)
+    ])
+    
+    if any(isinstance(outcome, Exception) for outcome in outcomes):
         sys.exit(1)
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of the MortalCoin smart contract in 0x-prefixed hex format.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
 @click.option(
     "--game-id",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Game ID in 0x-prefixed hex format.",
 )
 @click.option(
@@ -605,6 +839,7 @@ def post_position_command(
 @click.option(
     "--nonce",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Nonce in 0x-prefixed hex format.",
 )
 @click.option(
@@ -613,11 +848,11 @@ def post_position_command(
     help="Private key of the player in 0x-prefixed hex format.",
 )
 def close_position_command(
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
     contract_address: str,
-    game_id: str,
+    game_id: int,
     direction: str,
-    nonce: str,
+    nonce: int,
     player_privkey: str,
 ):
     """
@@ -632,72 +867,48 @@ def close_position_command(
     The command submits a transaction from the player's account to close the position.
     It waits for confirmation and prints the transaction hash.
     """
-    try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        
-        # Convert game_id from hex to int if it's in hex format
-        if game_id.startswith("0x"):
-            game_id_int = int(game_id, 16)
-        else:
-            try:
-                game_id_int = int(game_id)
-            except ValueError:
-                click.echo(f"Error: Invalid game ID format: {game_id}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Convert direction to enum value
-        direction_enum = Direction.Long if direction.lower() == "long" else Direction.Short
-        
-        # Convert nonce from hex to int if it's in hex format
-        if nonce.startswith("0x"):
-            nonce_int = int(nonce, 16)
-        else:
-            try:
-                nonce_int = int(nonce)
-            except ValueError:
-                click.echo(f"Error: Invalid nonce format: {nonce}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Close the position
-        click.echo(f"Closing {direction} position for game {game_id} with nonce {nonce}...")
-        tx_hash = close_position(
-            web3=web3,
-            contract=contract,
-            private_key=player_privkey,
-            game_id=game_id_int,
-            direction=direction_enum,
-            nonce=nonce_int,
-        )
-        
-        click.echo(f"Transaction hash: {tx_hash}")
-        
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        sys.exit(1)
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        close_position,
+    )
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Convert direction to enum value
+    direction_enum = _direction(direction)
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Close the position
+    click.echo(f"Closing {direction} position for game {game_id} with nonce {nonce}...")
+    tx_hash = close_position(
+        web3=web3,
+        contract=contract,
+        private_key=player_privkey,
+        game_id=game_id,
+        direction=direction_enum,
+        nonce=nonce,
+    )
+    
+    click.echo(f"Transaction hash: {tx_hash}")
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of the MortalCoin smart contract in 0x-prefixed hex format.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
@@ -709,6 +920,7 @@ def close_position_command(
 @click.option(
     "--game-id",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Game ID in 0x-prefixed hex format.",
 )
 @click.option(
@@ -720,15 +932,16 @@ def close_position_command(
 @click.option(
     "--nonce",
     required=False,
+    type=HEX_OR_DECIMAL_INT,
     help="Nonce in 0x-prefixed hex format. Optional.",
 )
 def finish_game_command(
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
     contract_address: str,
     player_privkey: str,
-    game_id: str,
+    game_id: int,
     direction: str = None,
-    nonce: str = None,
+    nonce: Optional[int] = None,
 ):
     """
     Finish a game on the blockchain.
@@ -742,84 +955,59 @@ def finish_game_command(
     The command submits a transaction from the player's account to finish the game.
     It waits for confirmation and prints the transaction hash.
     """
-    try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        
-        # Convert game_id from hex to int if it's in hex format
-        if game_id.startswith("0x"):
-            game_id_int = int(game_id, 16)
-        else:
-            try:
-                game_id_int = int(game_id)
-            except ValueError:
-                click.echo(f"Error: Invalid game ID format: {game_id}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Convert direction to enum value if provided
-        direction_enum = None
-        if direction:
-            direction_enum = Direction.Long if direction.lower() == "long" else Direction.Short
-        else:
-            # If direction is not provided, default to Long
-            direction_enum = Direction.Long
-            click.echo("Direction not provided, defaulting to Long.")
-        
-        # Convert nonce from hex to int if it's in hex format and provided
-        nonce_int = None
-        if nonce:
-            if nonce.startswith("0x"):
-                nonce_int = int(nonce, 16)
-            else:
-                try:
-                    nonce_int = int(nonce)
-                except ValueError:
-                    click.echo(f"Error: Invalid nonce format: {nonce}. Must be a decimal number or 0x-prefixed hex.")
-                    sys.exit(1)
-        else:
-            # If nonce is not provided, default to 0
-            nonce_int = 0
-            click.echo("Nonce not provided, defaulting to 0.")
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Finish the game
-        click.echo(f"Finishing game {game_id} with direction {direction_enum.name} and nonce {nonce_int}...")
-        tx_hash = finish_game(
-            web3=web3,
-            contract=contract,
-            private_key=player_privkey,
-            game_id=game_id_int,
-            direction=direction_enum,
-            nonce=nonce_int,
-        )
-        
-        click.echo(f"Transaction hash: {tx_hash}")
-        
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        sys.exit(1)
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        finish_game,
+    )
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Convert direction to enum value if provided
+    direction_enum = None
+    if direction:
+        direction_enum = _direction(direction)
+    else:
+        # If direction is not provided, default to Long
+        direction_enum = _direction("long")
+        click.echo("Direction not provided, defaulting to Long.")
+    
+    # Default the nonce to 0 if it is not provided
+    if nonce is None:
+        nonce = 0
+        click.echo("Nonce not provided, defaulting to 0.")
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Finish the game
+    click.echo(f"Finishing game {game_id} with direction {direction_enum.name} and nonce {nonce}...")
+    tx_hash = finish_game(
+        web3=web3,
+        contract=contract,
+        private_key=player_privkey,
+        game_id=game_id,
+        direction=direction_enum,
+        nonce=nonce,
+    )
+    
+    click.echo(f"Transaction hash: {tx_hash}")
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Address of the MortalCoin smart contract in 0x-prefixed hex format.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
@@ -831,6 +1019,7 @@ def finish_game_command(
 @click.option(
     "--game-id",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Game ID in 0x-prefixed hex format.",
 )
 @click.option(
@@ -842,6 +1031,7 @@ def finish_game_command(
 @click.option(
     "--player1-nonce",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Player1's nonce in 0x-prefixed hex format.",
 )
 @click.option(
@@ -853,17 +1043,18 @@ def finish_game_command(
 @click.option(
     "--player2-nonce",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Player2's nonce in 0x-prefixed hex format.",
 )
 def force_finish_game_command(
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
     contract_address: str,
     backend_privkey: str,
-    game_id: str,
+    game_id: int,
     player1_direction: str,
-    player1_nonce: str,
+    player1_nonce: int,
     player2_direction: str,
-    player2_nonce: str,
+    player2_nonce: int,
 ):
     """
     Force finish a game on the blockchain.
@@ -879,93 +1070,61 @@ def force_finish_game_command(
     The command submits a transaction from the backend's account to force finish the game.
     It waits for confirmation and prints the transaction hash.
     """
-    try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        
-        # Convert game_id from hex to int if it's in hex format
-        if game_id.startswith("0x"):
-            game_id_int = int(game_id, 16)
-        else:
-            try:
-                game_id_int = int(game_id)
-            except ValueError:
-                click.echo(f"Error: Invalid game ID format: {game_id}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Convert directions to enum values
-        player1_direction_enum = Direction.Long if player1_direction.lower() == "long" else Direction.Short
-        player2_direction_enum = Direction.Long if player2_direction.lower() == "long" else Direction.Short
-        
-        # Convert nonces from hex to int if they're in hex format
-        if player1_nonce.startswith("0x"):
-            player1_nonce_int = int(player1_nonce, 16)
-        else:
-            try:
-                player1_nonce_int = int(player1_nonce)
-            except ValueError:
-                click.echo(f"Error: Invalid player1 nonce format: {player1_nonce}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-                
-        if player2_nonce.startswith("0x"):
-            player2_nonce_int = int(player2_nonce, 16)
-        else:
-            try:
-                player2_nonce_int = int(player2_nonce)
-            except ValueError:
-                click.echo(f"Error: Invalid player2 nonce format: {player2_nonce}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Force finish the game
-        click.echo(f"Force finishing game {game_id}...")
-        click.echo(f"Player1 direction: {player1_direction_enum.name}, nonce: {player1_nonce_int}")
-        click.echo(f"Player2 direction: {player2_direction_enum.name}, nonce: {player2_nonce_int}")
-        
-        tx_hash = force_finish_game(
-            web3=web3,
-            contract=contract,
-            private_key=backend_privkey,
-            game_id=game_id_int,
-            player1_direction=player1_direction_enum,
-            player1_nonce=player1_nonce_int,
-            player2_direction=player2_direction_enum,
-            player2_nonce=player2_nonce_int,
-        )
-        
-        click.echo(f"Transaction hash: {tx_hash}")
-        
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        sys.exit(1)
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        force_finish_game,
+    )
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Convert directions to enum values
+    player1_direction_enum = _direction(player1_direction)
+    player2_direction_enum = _direction(player2_direction)
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Force finish the game
+    click.echo(f"Force finishing game {game_id}...")
+    click.echo(f"Player1 direction: {player1_direction_enum.name}, nonce: {player1_nonce}")
+    click.echo(f"Player2 direction: {player2_direction_enum.name}, nonce: {player2_nonce}")
+    
+    tx_hash = force_finish_game(
+        web3=web3,
+        contract=contract,
+        private_key=backend_privkey,
+        game_id=game_id,
+        player1_direction=player1_direction_enum,
+        player1_nonce=player1_nonce,
+        player2_direction=player2_direction_enum,
+        player2_nonce=player2_nonce,
+    )
+    
+    click.echo(f"Transaction hash: {tx_hash}")
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Smart contract address in 0x-prefixed hex format.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
 @click.option(
     "--game-id",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Game ID in 0x-prefixed hex format or decimal.",
 )
 @click.option(
@@ -979,18 +1138,27 @@ def force_finish_game_command(
     required=True,
     help="Transaction hash in 0x-prefixed hex format.",
 )
+@click.option(
+    "--output",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format of the validation results.",
+)
 @click.option(
     "--nonce",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Nonce in 0x-prefixed hex format or decimal.",
 )
 def validate_post_position_command(
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
     contract_address: str,
-    game_id: str,
+    game_id: int,
     direction: str,
     transaction_hash: str,
-    nonce: str,
+    nonce: int,
+    output: str,
 ):
     """
     Validate a transaction that posted a position.
@@ -1001,85 +1169,68 @@ def validate_post_position_command(
     - The transaction called postPosition with the provided game ID
     - The hashed direction in the transaction matches the calculated hashed direction
     """
-    try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        
-        # Convert game_id from hex to int if it's in hex format
-        if game_id.startswith("0x"):
-            game_id_int = int(game_id, 16)
-        else:
-            try:
-                game_id_int = int(game_id)
-            except ValueError:
-                click.echo(f"Error: Invalid game ID format: {game_id}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Convert nonce from hex to int if it's in hex format
-        if nonce.startswith("0x"):
-            nonce_int = int(nonce, 16)
-        else:
-            try:
-                nonce_int = int(nonce)
-            except ValueError:
-                click.echo(f"Error: Invalid nonce format: {nonce}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Convert direction string to Direction enum
-        direction_enum = Direction.Long if direction.lower() == "long" else Direction.Short
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Validate the transaction
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        validate_post_position_transaction,
+    )
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Convert direction string to Direction enum
+    direction_enum = _direction(direction)
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Validate the transaction, keeping stdout to the JSON document in json mode
+    if output == "text":
         click.echo(f"Validating transaction {transaction_hash} for game ID {game_id}...")
-        validation_result = validate_post_position_transaction(
-            web3=web3,
-            contract=contract,
-            game_id=game_id_int,
-            tx_hash=transaction_hash,
-            direction=direction_enum,
-            nonce=nonce_int,
-        )
-        
-        # Print the validation results
-        click.echo("Validation successful!")
-        click.echo("Results:")
-        click.echo(f"- Transaction confirmed: {validation_result['confirmed']}")
-        click.echo(f"- Transaction successful: {validation_result['successful']}")
-        click.echo(f"- Called postPosition function: {validation_result['called_post_position']}")
-        click.echo(f"- Game ID matches: {validation_result['game_id_match']}")
-        click.echo(f"- Hashed direction matches: {validation_result['hashed_direction_match']}")
-        
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        sys.exit(1)
+    validation_result = validate_post_position_transaction(
+        web3=web3,
+        contract=contract,
+        game_id=game_id,
+        tx_hash=transaction_hash,
+        direction=direction_enum,
+        nonce=nonce,
+    )
+    
+    # Print the validation results
+    if output == "json":
+        _emit_json(validation_result)
+        return
+    _echo_lines(
+        "Validation successful!",
+        "Results:",
+        f"- Transaction confirmed: {validation_result['confirmed']}",
+        f"- Transaction successful: {validation_result['successful']}",
+        f"- Called postPosition function: {validation_result['called_post_position']}",
+        f"- Game ID matches: {validation_result['game_id_match']}",
+        f"- Hashed direction matches: {validation_result['hashed_direction_match']}",
+    )
 
 
 @main.command()
+@_handle_errors
 @click.option(
     "--rpc-url",
     required=True,
-    help="URL of the Ethereum RPC endpoint.",
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
     envvar="MORTALCOIN_RPC_URL",
 )
 @click.option(
     "--contract-address",
     required=True,
+    type=CHECKSUM_ADDRESS,
     help="Smart contract address in 0x-prefixed hex format.",
     envvar="MORTALCOIN_CONTRACT_ADDRESS",
 )
 @click.option(
     "--game-id",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Game ID in 0x-prefixed hex format or decimal.",
 )
 @click.option(
@@ -1091,6 +1242,7 @@ def validate_post_position_command(
 @click.option(
     "--nonce",
     required=True,
+    type=HEX_OR_DECIMAL_INT,
     help="Nonce in 0x-prefixed hex format or decimal.",
 )
 @click.option(
@@ -1098,13 +1250,21 @@ def validate_post_position_command(
     required=True,
     help="Transaction hash in 0x-prefixed hex format.",
 )
+@click.option(
+    "--output",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format of the validation results.",
+)
 def validate_close_position_command(
-    rpc_url: str,
+    rpc_url: Tuple[str, ...],
     contract_address: str,
-    game_id: str,
+    game_id: int,
     direction: str,
-    nonce: str,
+    nonce: int,
     transaction_hash: str,
+    output: str,
 ):
     """
     Validate a transaction that closed a position.
@@ -1118,76 +1278,167 @@ def validate_close_position_command(
     It also extracts the PositionClosed event from transaction logs and displays
     position opening and closing prices and PnL.
     """
-    try:
-        # Connect to the blockchain
-        web3 = get_web3_connection(rpc_url)
-        
-        # Validate addresses
-        if not Web3.is_address(contract_address):
-            click.echo(f"Error: Invalid contract address: {contract_address}")
-            sys.exit(1)
-        
-        # Convert addresses to checksum format
-        contract_address = Web3.to_checksum_address(contract_address)
-        
-        # Convert game_id from hex to int if it's in hex format
-        if game_id.startswith("0x"):
-            game_id_int = int(game_id, 16)
-        else:
-            try:
-                game_id_int = int(game_id)
-            except ValueError:
-                click.echo(f"Error: Invalid game ID format: {game_id}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Convert nonce from hex to int if it's in hex format
-        if nonce.startswith("0x"):
-            nonce_int = int(nonce, 16)
-        else:
-            try:
-                nonce_int = int(nonce)
-            except ValueError:
-                click.echo(f"Error: Invalid nonce format: {nonce}. Must be a decimal number or 0x-prefixed hex.")
-                sys.exit(1)
-        
-        # Convert direction string to Direction enum
-        direction_enum = Direction.Long if direction.lower() == "long" else Direction.Short
-        
-        # Get the contract instance
-        contract = get_contract(web3, contract_address)
-        
-        # Validate the transaction
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        validate_close_position_transaction,
+    )
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Convert direction string to Direction enum
+    direction_enum = _direction(direction)
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Validate the transaction, keeping stdout to the JSON document in json mode
+    if output == "text":
         click.echo(f"Validating transaction {transaction_hash} for game ID {game_id}...")
-        validation_result = validate_close_position_transaction(
-            web3=web3,
-            contract=contract,
-            game_id=game_id_int,
-            tx_hash=transaction_hash,
-            direction=direction_enum,
-            nonce=nonce_int,
-        )
-        
-        # Print the validation results
-        click.echo("Validation successful!")
-        click.echo("Results:")
-        click.echo(f"- Transaction confirmed: {validation_result['confirmed']}")
-        click.echo(f"- Transaction successful: {validation_result['successful']}")
-        click.echo(f"- Transaction sent to contract address: True")
-        click.echo(f"- Called closePosition function: {validation_result['called_close_position']}")
-        click.echo(f"- Game ID matches: {validation_result['game_id_match']}")
-        click.echo(f"- Direction matches: {validation_result['direction_match']}")
-        click.echo(f"- Nonce matches: {validation_result['nonce_match']}")
-        
-        # Print the position data
-        position_data = validation_result['position_data']
-        click.echo("\nPosition Data:")
-        click.echo(f"- Opening Price: {position_data['opening_price']}")
-        click.echo(f"- Closing Price: {position_data['closing_price']}")
-        click.echo(f"- Direction: {'Long' if position_data['direction'] == 0 else 'Short'}")
-        click.echo(f"- PnL: {position_data['pnl']}")
-        
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
+    validation_result = validate_close_position_transaction(
+        web3=web3,
+        contract=contract,
+        game_id=game_id,
+        tx_hash=transaction_hash,
+        direction=direction_enum,
+        nonce=nonce,
+    )
+    
+    # Print the validation results and the position data
+    if output == "json":
+        _emit_json(validation_result)
+        return
+    position_data = validation_result['position_data']
+    _echo_lines(
+        "Validation successful!",
+        "Results:",
+        f"- Transaction confirmed: {validation_result['confirmed']}",
+        f"- Transaction successful: {validation_result['successful']}",
+        f"- Transaction sent to contract address: True",
+        f"- Called closePosition function: {validation_result['called_close_position']}",
+        f"- Game ID matches: {validation_result['game_id_match']}",
+        f"- Direction matches: {validation_result['direction_match']}",
+        f"- Nonce matches: {validation_result['nonce_match']}",
+        # The position data goes out in the same write as the results
+        "\nPosition Data:",
+        f"- Opening Price: {position_data['opening_price']}",
+        f"- Closing Price: {position_data['closing_price']}",
+        f"- Direction: {'Long' if position_data['direction'] == 0 else 'Short'}",
+        f"- PnL: {position_data['pnl']}",
+    )
+
+
+@main.command("validate-many")
+@_handle_errors
+@click.option(
+    "--rpc-url",
+    required=True,
+    multiple=True,
+    help="URL of the Ethereum RPC endpoint. Repeat it to fail over between HTTP(S) endpoints.",
+    envvar="MORTALCOIN_RPC_URL",
+)
+@click.option(
+    "--contract-address",
+    required=True,
+    type=CHECKSUM_ADDRESS,
+    help="Address of the MortalCoin smart contract in 0x-prefixed hex format.",
+    envvar="MORTALCOIN_CONTRACT_ADDRESS",
+)
+@click.option(
+    "--input-file",
+    required=True,
+    type=click.File("r"),
+    help="JSON file with a list of transactions to validate, or - for stdin.",
+)
+@click.option(
+    "--batch-size",
+    default=100,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of transactions validated together before their results are printed.",
+)
+def validate_many_command(
+    rpc_url: Tuple[str, ...],
+    contract_address: str,
+    input_file,
+    batch_size: int,
+):
+    """
+    Validate several transactions at once.
+    
+    Each entry of the input file is an object with a "type" (create_game,
+    join_game, post_position or close_position), a "tx_hash" and a "game_id",
+    plus the "pool_address" for create_game and join_game, or the "direction"
+    and "nonce" for post_position and close_position. Game IDs and nonces are
+    given as decimal numbers or 0x-prefixed hex.
+    
+    The transactions are validated in groups of --batch-size, in one process,
+    instead of one validate command invocation per transaction; the receipts
+    and transactions of a group are requested in a few JSON-RPC batches. The
+    result of every transaction is printed as a line of JSON (JSON Lines) as
+    soon as its group is validated. Warnings are printed to stderr, so stdout
+    only holds the JSON lines.
+    """
+    from mortalcoin_evm_cli.blockchain import (
+        get_web3_connection,
+        get_contract,
+        validate_close_position_transaction,
+        validate_create_game_transaction,
+        validate_join_game_transaction,
+        validate_many,
+        validate_post_position_transaction,
+    )
+    
+    validators = {
+        "create_game": validate_create_game_transaction,
+        "join_game": validate_join_game_transaction,
+        "post_position": validate_post_position_transaction,
+        "close_position": validate_close_position_transaction,
+    }
+    
+    # Read the transactions before connecting, so a malformed file fails fast
+    try:
+        validations = []
+        for entry in json.load(input_file):
+            validator = validators.get(entry["type"])
+            if validator is None:
+                raise ValueError(f"unknown transaction type {entry['type']!r}")
+            kwargs = {
+                "game_id": _parse_int(str(entry["game_id"]), "game ID"),
+                "tx_hash": str(entry["tx_hash"]),
+            }
+            if entry["type"] in ("create_game", "join_game"):
+                kwargs["pool_address"] = _checksum_address(str(entry["pool_address"]))
+                if kwargs["pool_address"] is None:
+                    raise ValueError(f"invalid pool address {entry['pool_address']}")
+            else:
+                kwargs["direction"] = _direction(str(entry["direction"]))
+                kwargs["nonce"] = _parse_int(str(entry["nonce"]), "nonce")
+            validations.append((validator, kwargs))
+    except (ValueError, TypeError, KeyError) as e:
+        click.echo(f"Error: Invalid input file: {e}", err=True)
+        sys.exit(1)
+    
+    # Connect to the blockchain
+    web3 = get_web3_connection(rpc_url)
+    
+    # Get the contract instance
+    contract = get_contract(web3, contract_address)
+    
+    # Validate the transactions one group at a time, printing each group's results
+    # before fetching the next one
+    failed = False
+    for start in range(0, len(validations), batch_size):
+        batch = validations[start:start + batch_size]
+        for (_, kwargs), outcome in zip(batch, validate_many(web3, contract, batch)):
+            if isinstance(outcome, Exception):
+                failed = True
+                _emit_json({"tx_hash": kwargs["tx_hash"], "valid": False, "error": str(outcome)}, indent=False)
+            else:
+                _emit_json({"tx_hash": kwargs["tx_hash"], "valid": True, "result": outcome}, indent=False)
+    
+    if failed:
         sys.exit(1)
 
 
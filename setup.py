@@ -5,17 +5,28 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     include_package_data=True,
+    package_data={
+        "mortalcoin_evm_cli": ["abi.json"],
+    },
     install_requires=[
         "web3==7.12.1",
         "click>=8.0.0",
         "python-dotenv>=0.19.0",
     ],
+    extras_require={
+        # Optional faster implementations of hot paths
+        "fast": [
+            "orjson>=3.0.0",
+            # eth-keys signs with libsecp256k1 instead of pure Python when installed
+            "coincurve>=17.0.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "mortalcoin=mortalcoin_evm_cli.cli:main",
         ],
     },
-    python_requires=">=3.8",
+    python_requires=">=3.11",
     description="CLI tool for interacting with MortalCoin EVM smart contracts",
     author="MortalCoin Team",
 )
\ No newline at end of file
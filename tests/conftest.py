@@ -0,0 +1,14 @@
+"""Shared fixtures of the tests."""
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture
+def cli_runner():
+    """Get a CliRunner that keeps stderr apart from stdout on every Click version."""
+    try:
+        # Click before 8.2 mixes stderr into stdout unless told otherwise
+        return CliRunner(mix_stderr=False)
+    except TypeError:
+        return CliRunner()
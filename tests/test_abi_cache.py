@@ -0,0 +1,45 @@
+"""Tests for the on-disk cache of the parsed ABI."""
+
+import json
+import os
+
+import pytest
+
+from mortalcoin_evm_cli import blockchain
+
+
+@pytest.fixture
+def abi_cache(monkeypatch, tmp_path):
+    """Cache the ABI in a temporary directory, and forget the ABI loaded in this process."""
+    monkeypatch.setattr(blockchain, "ABI_CACHE_DIR", tmp_path / "cache")
+    blockchain.load_abi.cache_clear()
+    yield tmp_path
+    blockchain.load_abi.cache_clear()
+
+
+def write_abi(path, name):
+    path.write_text(json.dumps([{"type": "function", "name": name, "inputs": [], "outputs": []}]))
+    # Same modification time (and size) for every file
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+
+def load(monkeypatch, path):
+    monkeypatch.setenv(blockchain.ABI_PATH_ENV, str(path))
+    blockchain.load_abi.cache_clear()
+    return blockchain.load_abi()[0]["name"]
+
+
+def test_abi_files_with_the_same_size_and_time_have_their_own_cache(monkeypatch, abi_cache):
+    write_abi(abi_cache / "a.json", "fooA")
+    write_abi(abi_cache / "b.json", "fooB")
+    
+    assert load(monkeypatch, abi_cache / "a.json") == "fooA"
+    assert load(monkeypatch, abi_cache / "b.json") == "fooB"
+    assert len(list((abi_cache / "cache").glob("abi-*.pkl"))) == 2
+    
+    # Switching between the files does not replace their cache: a file rewritten
+    # with the same size and time is still read from its own cache file
+    (abi_cache / "a.json").unlink()
+    write_abi(abi_cache / "a.json", "fooC")
+    assert load(monkeypatch, abi_cache / "a.json") == "fooA"
+    assert load(monkeypatch, abi_cache / "b.json") == "fooB"
@@ -0,0 +1,29 @@
+"""Tests for the failover between several HTTP RPC endpoints."""
+
+import requests
+
+from mortalcoin_evm_cli import blockchain
+
+
+def flaky_send():
+    """Get a request sender whose first request cannot reach the endpoint."""
+    attempts = []
+    
+    def send():
+        attempts.append(None)
+        if len(attempts) == 1:
+            raise requests.ConnectionError("connection refused")
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+    return send
+
+
+def test_failover_switches_endpoint_and_warns_on_stderr(capsys):
+    provider = blockchain.FailoverHTTPProvider(("http://localhost:8545", "http://localhost:8546"))
+    
+    assert provider._with_failover(flaky_send()) == {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+    assert provider.endpoint_uri == "http://localhost:8546"
+    
+    # Warnings go to stderr, so they never mix with JSON printed to stdout
+    output = capsys.readouterr()
+    assert "Warning: RPC endpoint http://localhost:8545 failed (connection refused)" in output.err
+    assert output.out == ""
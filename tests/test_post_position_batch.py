@@ -0,0 +1,150 @@
+"""Tests for the post-position-batch command."""
+
+import json
+import sys
+
+import pytest
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from mortalcoin_evm_cli import blockchain
+from mortalcoin_evm_cli.cli import main
+
+
+CONTRACT_ADDRESS = "0x" + "11" * 20
+PLAYER_KEY = "0x" + "01" * 32
+BACKEND_KEY = "0x" + "02" * 32
+
+
+@pytest.fixture
+def posted(monkeypatch):
+    """Replace the connection and post_positions, recording the positions they get."""
+    calls = []
+    
+    def fake_post_positions(web3, contract, player_private_key, backend_private_key, positions):
+        calls.append(positions)
+        # Progress messages of the library must not end up in the JSON output
+        print("Using EIP-1559 transaction format")
+        print("Transaction sent: 0x01")
+        # Click before 8.2 does not flush the captured stderr of print calls itself
+        sys.stderr.flush()
+        return ["0x01", ValueError("Transaction 0x02 reverted")]
+    
+    monkeypatch.setattr(blockchain, "get_web3_connection", lambda rpc_url: object())
+    monkeypatch.setattr(blockchain, "get_contract", lambda web3, address: object())
+    monkeypatch.setattr(blockchain, "post_positions", fake_post_positions)
+    return calls
+
+
+def invoke(runner, entries):
+    return runner.invoke(
+        main,
+        ["post-position-batch", "--rpc-url", "http://localhost:8545", "--contract-address", CONTRACT_ADDRESS,
+         "--player-privkey", PLAYER_KEY, "--backend-privkey", BACKEND_KEY, "--input-file", "-"],
+        input=json.dumps(entries),
+    )
+
+
+def test_post_position_batch_prints_only_json_to_stdout(cli_runner, posted):
+    result = invoke(cli_runner, [
+        {"game_id": "0x1", "direction": "Long", "nonce": "0x2a"},
+        {"game_id": 2, "direction": "short", "nonce": 7},
+    ])
+    
+    assert result.exit_code == 1
+    assert json.loads(result.stdout) == [
+        {"game_id": 1, "tx_hash": "0x01"},
+        {"game_id": 2, "error": "Transaction 0x02 reverted"},
+    ]
+    assert "Posting 2 positions..." in result.stderr
+    assert "Transaction sent: 0x01" in result.stderr
+    assert posted == [[(1, blockchain.Direction.Long, 42), (2, blockchain.Direction.Short, 7)]]
+
+
+def test_post_position_batch_rejects_malformed_entries_before_connecting(cli_runner, posted):
+    result = invoke(cli_runner, [{"game_id": 1, "direction": "Long"}])
+    
+    assert result.exit_code == 1
+    assert "Error: Invalid input file: 'nonce'" in result.stderr
+    assert result.stdout == ""
+    assert posted == []
+
+
+class StubNode(BaseProvider):
+    """Provider standing in for a node, which mines every transaction it accepts."""
+    
+    def __init__(self, reverted=(), rejected=()):
+        super().__init__()
+        # Indexes, in sending order, of the transactions that revert or are rejected
+        self.reverted = set(reverted)
+        self.rejected = set(rejected)
+        self.sent = []
+        self.receipts = {}
+    
+    def make_request(self, method, params):
+        if method == "eth_sendRawTransaction":
+            index = len(self.sent)
+            self.sent.append(params[0])
+            if index in self.rejected:
+                return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "insufficient funds"}}
+            tx_hash = Web3.keccak(hexstr=params[0]).to_0x_hex()
+            self.receipts[tx_hash] = {
+                "transactionHash": tx_hash,
+                "blockNumber": "0x10",
+                "status": "0x0" if index in self.reverted else "0x1",
+                "gasUsed": "0x5208",
+                "logs": [],
+            }
+            return {"jsonrpc": "2.0", "id": 1, "result": tx_hash}
+        results = {
+            "eth_chainId": "0x1",
+            "eth_getTransactionCount": "0x5",
+            "eth_feeHistory": {"oldestBlock": "0x1", "baseFeePerGas": ["0x1", "0x1"], "gasUsedRatio": [0.5],
+                               "reward": [["0x1"]]},
+            "eth_estimateGas": "0x10000",
+            "eth_getTransactionReceipt": self.receipts.get(params[0]) if params else None,
+        }
+        return {"jsonrpc": "2.0", "id": 1, "result": results[method]}
+    
+    def make_batch_request(self, requests):
+        return [self.make_request(method, params) for method, params in requests]
+
+
+def post(node, count):
+    web3 = Web3(node)
+    contract = blockchain.get_contract(web3, Web3.to_checksum_address(CONTRACT_ADDRESS))
+    return blockchain.post_positions(
+        web3, contract, PLAYER_KEY, BACKEND_KEY,
+        [(game_id, blockchain.Direction.Long, 7) for game_id in range(1, count + 1)],
+        static_gas=True,
+    )
+
+
+def sent_nonces(node):
+    return [TypedTransaction.from_bytes(HexBytes(raw)).as_dict()["nonce"] for raw in node.sent]
+
+
+def test_post_positions_reports_reverted_transactions():
+    node = StubNode(reverted={1})
+    
+    outcomes = post(node, 3)
+    
+    assert [isinstance(outcome, Exception) for outcome in outcomes] == [False, True, False]
+    assert str(outcomes[1]) == f"Transaction {Web3.keccak(hexstr=node.sent[1]).to_0x_hex()} reverted"
+    assert sent_nonces(node) == [5, 6, 7]
+
+
+def test_post_positions_fails_the_transactions_sent_after_a_rejected_nonce():
+    node = StubNode(rejected={1})
+    
+    outcomes = post(node, 3)
+    
+    assert sent_nonces(node) == [5, 6, 7]
+    assert isinstance(outcomes[0], str)
+    assert "insufficient funds" in str(outcomes[1])
+    later_hash = Web3.keccak(hexstr=node.sent[2]).to_0x_hex()
+    assert str(outcomes[2]) == (
+        f"Transaction {later_hash} has nonce 7 and stays pending until a transaction with the rejected nonce 6 is sent"
+    )
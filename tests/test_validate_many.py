@@ -0,0 +1,221 @@
+"""Tests for the validate-many command and its batched validation helpers."""
+
+import json
+import sys
+from typing import Any, Dict, List
+
+import pytest
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from mortalcoin_evm_cli import blockchain
+from mortalcoin_evm_cli.cli import main
+
+
+CONTRACT_ADDRESS = "0x" + "11" * 20
+POOL_ADDRESS = "0x" + "22" * 20
+FOUND_HASH = "0x" + "aa" * 32
+MISSING_HASH = "0x" + "bb" * 32
+UNKNOWN_HASH = "0x" + "cc" * 32
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    """Replace the connection and validate_many, recording the validations they get."""
+    calls = []
+    
+    def fake_validate_many(web3, contract, batch):
+        calls.append(batch)
+        # Warnings of the library must not end up in the JSON Lines output
+        print("Warning: Could not batch requests", file=sys.stderr)
+        # Click before 8.2 does not flush the captured stderr of print calls itself
+        sys.stderr.flush()
+        return [
+            ValueError("Transaction not found") if kwargs["tx_hash"] == "0xbad" else {"confirmed": True}
+            for _, kwargs in batch
+        ]
+    
+    monkeypatch.setattr(blockchain, "get_web3_connection", lambda rpc_url: object())
+    monkeypatch.setattr(blockchain, "get_contract", lambda web3, address: object())
+    monkeypatch.setattr(blockchain, "validate_many", fake_validate_many)
+    return calls
+
+
+class BrokenBatchWeb3:
+    """Web3 stand-in whose provider cannot send batches."""
+    
+    class provider:
+        @staticmethod
+        def make_batch_request(requests):
+            raise ConnectionError("batch refused")
+
+
+def invoke(runner, entries, *args):
+    return runner.invoke(
+        main,
+        ["validate-many", "--rpc-url", "http://localhost:8545", "--contract-address", CONTRACT_ADDRESS,
+         "--input-file", "-", *args],
+        input=json.dumps(entries),
+    )
+
+
+def test_validate_many_prints_one_json_line_per_transaction(cli_runner, validations):
+    entries = [
+        {"type": "create_game", "tx_hash": "0x01", "game_id": 1, "pool_address": POOL_ADDRESS},
+        {"type": "post_position", "tx_hash": "0xbad", "game_id": "0x1", "direction": "LONG", "nonce": 7},
+        {"type": "close_position", "tx_hash": "0x03", "game_id": 1, "direction": "short", "nonce": "0x7"},
+    ]
+    result = invoke(cli_runner, entries, "--batch-size", "2")
+    
+    assert result.exit_code == 1
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [
+        {"tx_hash": "0x01", "valid": True, "result": {"confirmed": True}},
+        {"tx_hash": "0xbad", "valid": False, "error": "Transaction not found"},
+        {"tx_hash": "0x03", "valid": True, "result": {"confirmed": True}},
+    ]
+    assert "Warning: Could not batch requests" in result.stderr
+    
+    # The transactions are validated in groups of --batch-size, with parsed arguments
+    assert [len(batch) for batch in validations] == [2, 1]
+    post_kwargs = validations[0][1][1]
+    assert post_kwargs == {
+        "game_id": 1,
+        "tx_hash": "0xbad",
+        "direction": blockchain.Direction.Long,
+        "nonce": 7,
+    }
+    assert validations[0][0][1]["pool_address"] == blockchain.Web3.to_checksum_address(POOL_ADDRESS)
+
+
+def test_validate_many_succeeds_when_every_transaction_is_valid(cli_runner, validations):
+    result = invoke(cli_runner, [{"type": "join_game", "tx_hash": "0x01", "game_id": 1, "pool_address": POOL_ADDRESS}])
+    
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {"tx_hash": "0x01", "valid": True, "result": {"confirmed": True}}
+
+
+@pytest.mark.parametrize("entry, message", [
+    ({"type": "nope", "tx_hash": "0x01", "game_id": 1}, "unknown transaction type 'nope'"),
+    ({"type": "create_game", "tx_hash": "0x01", "game_id": 1, "pool_address": "0x12"}, "invalid pool address 0x12"),
+    ({"type": "post_position", "tx_hash": "0x01", "game_id": 1}, "'direction'"),
+])
+def test_validate_many_rejects_malformed_entries_before_connecting(cli_runner, validations, entry, message):
+    result = invoke(cli_runner, [entry])
+    
+    assert result.exit_code == 1
+    assert f"Error: Invalid input file: {message}" in result.stderr
+    assert result.stdout == ""
+    assert validations == []
+
+
+class StubProvider(BaseProvider):
+    """Provider that answers with canned responses, recording the batches it gets."""
+    
+    def __init__(self, results: Dict[tuple, Any], batches: bool = True):
+        super().__init__()
+        self.results = results
+        self.batches = batches
+        self.batch_requests: List[list] = []
+    
+    def _response(self, method, params):
+        result = self.results.get((method, params[0]))
+        if isinstance(result, Exception):
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": str(result)}}
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+    
+    def make_request(self, method, params):
+        return self._response(method, params)
+    
+    def make_batch_request(self, requests):
+        self.batch_requests.append(requests)
+        if not self.batches:
+            # What nodes without batch support answer with
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batches not supported"}}
+        return [self._response(method, params) for method, params in requests]
+
+
+@pytest.fixture(autouse=True)
+def receipt_cache(monkeypatch):
+    """Start every test with an empty receipt cache."""
+    monkeypatch.setattr(blockchain, "_RECEIPT_CACHE", {})
+
+
+def canned_results():
+    receipt = {
+        "transactionHash": FOUND_HASH,
+        "blockNumber": "0x10",
+        "status": "0x1",
+        "logs": [],
+        "to": CONTRACT_ADDRESS,
+    }
+    tx = {"hash": FOUND_HASH, "blockNumber": "0x10", "to": CONTRACT_ADDRESS, "input": "0x", "value": "0x0"}
+    return {
+        ("eth_getTransactionReceipt", FOUND_HASH): receipt,
+        ("eth_getTransactionByHash", FOUND_HASH): tx,
+        ("eth_getTransactionReceipt", MISSING_HASH): ValueError("receipt lookup failed"),
+    }
+
+
+def test_fetch_transactions_reads_every_hash_in_one_batch():
+    provider = StubProvider(canned_results())
+    
+    fetched = blockchain._fetch_transactions(Web3(provider), [FOUND_HASH, MISSING_HASH])
+    
+    assert [[method for method, _ in requests] for requests in provider.batch_requests] == [[
+        "eth_getTransactionReceipt", "eth_getTransactionByHash",
+        "eth_getTransactionReceipt", "eth_getTransactionByHash",
+    ]]
+    (found_receipt, found_tx), missing = fetched
+    assert found_receipt["blockNumber"] == 16 and found_receipt["status"] == 1
+    assert found_tx["to"] == Web3.to_checksum_address(CONTRACT_ADDRESS)
+    # The failed receipt request and the unknown transaction both give None
+    assert missing == (None, None)
+    
+    # The fetched receipt is cached, and so not requested again
+    blockchain._fetch_transactions(Web3(provider), [FOUND_HASH])
+    assert [method for method, _ in provider.batch_requests[-1]] == ["eth_getTransactionByHash"]
+
+
+def test_make_raw_batch_stops_batching_on_providers_without_batch_support(capsys):
+    provider = StubProvider(canned_results(), batches=False)
+    web3 = Web3(provider)
+    
+    assert blockchain._fetch_transactions(web3, [FOUND_HASH]) == [(None, None)]
+    assert blockchain._make_raw_batch(web3, [("eth_chainId", [])]) is None
+    # The rejected batch is not sent again on the same connection
+    assert len(provider.batch_requests) == 1
+    
+    # Warnings go to stderr, so they never mix with JSON printed to stdout
+    assert blockchain._make_raw_batch(BrokenBatchWeb3(), [("eth_chainId", [])]) is None
+    output = capsys.readouterr()
+    assert "Warning: Could not batch requests: batch refused" in output.err
+    assert output.out == ""
+
+
+def test_validate_many_passes_the_fetched_data_to_the_validators():
+    provider = StubProvider(canned_results())
+    web3 = Web3(provider)
+    contract = blockchain.get_contract(web3, Web3.to_checksum_address(CONTRACT_ADDRESS))
+    
+    def validate_found(web3, contract, game_id, tx_hash, tx_receipt=None, tx=None):
+        return {"game_id": game_id, "block": tx_receipt["blockNumber"], "to": tx["to"]}
+    
+    results = blockchain.validate_many(web3, contract, [
+        (validate_found, {"game_id": 1, "tx_hash": FOUND_HASH}),
+        *(
+            (blockchain.validate_post_position_transaction, {
+                "game_id": 1,
+                "tx_hash": tx_hash,
+                "direction": blockchain.Direction.Long,
+                "nonce": 1,
+            })
+            for tx_hash in (UNKNOWN_HASH, MISSING_HASH)
+        ),
+    ])
+    
+    assert results[0] == {"game_id": 1, "block": 16, "to": Web3.to_checksum_address(CONTRACT_ADDRESS)}
+    # The validators of the transactions that could not be fetched requested them
+    # again on their own, and report the error as when validating one transaction
+    assert isinstance(results[1], ValueError) and str(results[1]) == "Transaction not found"
+    assert isinstance(results[2], Exception) and "receipt lookup failed" in str(results[2])
+    assert len(provider.batch_requests) == 3